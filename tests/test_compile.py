@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from tool_parse import tool
+from tool_parse.compile import compile_objects
+
+
+def test_batch_compile():
+    def reverse_string(string: str):
+        """Reverse the given string"""
+        return string[::-1]
+
+    async def search_web(query: str):
+        """Search the web."""
+        return f"results for {query!r}"
+
+    results = compile_objects(
+        [
+            (reverse_string, {"string": "tool"}),
+            (search_web, {"query": "tool-parse"}),
+            (search_web, '{"query": "asyncio"}'),
+        ]
+    )
+    assert results == ["loot", "results for 'tool-parse'", "results for 'asyncio'"]
+
+
+def test_compile_inside_running_loop():
+    @tool
+    async def greet(name: str) -> str:
+        """Greet someone."""
+        return f"hello {name}"
+
+    assert greet.compile(arguments={"name": "tool"}) == "hello tool"
+
+    async def __asyncio__():
+        # Without nest_asyncio applied, the running loop cannot be re-entered.
+        with pytest.raises(RuntimeError, match="nest_asyncio"):
+            greet.compile(arguments={"name": "loop"})
+
+    asyncio.run(__asyncio__())
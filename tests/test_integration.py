@@ -50,6 +50,19 @@ if sys.version_info >= (3, 9):
 
         asyncio.run(__asyncio__())
 
+    def test_from_objects():
+        def reverse_string(string: str):
+            """Reverse the given string"""
+            return string[::-1]
+
+        tool, *rest = ExtendedStructuredTool.from_objects(reverse_string, schema_spec="claude")
+        assert not rest
+        assert tool.name == "reverse_string"
+        # from_objects marshals the schema itself and hands it in
+        assert tool.tool_schema is not None
+        assert "input_schema" in tool.json_schema["function"]
+        assert tool.invoke(input={"string": "tool"}) == "loot"
+
     def test_langchain_chat_model(tools):
         class ChatMock(FakeChatModel):
             def bind_tools(self, tools: Any, **kwargs: Any):
@@ -1,3 +1,4 @@
+import json
 import typing as t
 
 import pytest
@@ -82,6 +83,19 @@ def test_independent_tool():
         )
 
 
+def test_marshal_json():
+    @tool
+    def reverse_string(string: str) -> str:
+        """Reverse the given string"""
+        return string[::-1]
+
+    data = reverse_string.marshal_json("base")
+    assert isinstance(data, bytes)
+    assert json.loads(data) == reverse_string.marshal("base")
+    # serialized once per spec; repeat calls serve the cached bytes
+    assert reverse_string.marshal_json("base") is data
+
+
 def test_recursive_parameter_exception():
     @tool
     class Model(t.NamedTuple):
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import copy
+import json
 import sys
 import typing as t
 
+try:
+    from orjson import dumps as _json_dumps  # type: ignore[import-not-found]
+except ImportError:
+
+    def _json_dumps(__obj: t.Any) -> bytes:
+        return json.dumps(__obj).encode()
+
+
 from . import _types as ts
 from . import compile, marshal
 
@@ -34,6 +44,20 @@ class tool:
     ):
         self._obj = __obj
         self.name = __obj.__name__
+        # The schema is a pure function of the decorated object and the
+        # spec set is closed, so both specs are built eagerly here — at
+        # import time — instead of on every `marshal()` call. Objects whose
+        # annotations cannot resolve yet (e.g. references defined later in
+        # the module) fall back to lazy marshaling.
+        self._schemas: t.Dict[str, ts.ToolSchema] = {}
+        self._schemas_json: t.Dict[str, bytes] = {}
+        frame = sys._getframe(1)
+        for spec in ("base", "claude"):
+            try:
+                self._schemas[spec] = marshal.marshal_object(__obj, spec=spec, frame=frame)
+            except Exception:
+                self._schemas.clear()
+                break
 
     def __call__(self, *args, **kwargs):
         """Call the tool object. Sorry can't figure out how to add parameter type hints."""
@@ -41,8 +65,22 @@ class tool:
 
     def marshal(self, __spec: t.Literal["base", "claude"]) -> ts.ToolSchema:
         """Get tool schema"""
+        if (schema := self._schemas.get(__spec)) is not None:
+            # Deep copy so caller mutation cannot corrupt the precomputed
+            # schema or the bytes served by `marshal_json`.
+            return copy.deepcopy(schema)
         return marshal.marshal_object(self._obj, spec=__spec, frame=sys._getframe(1))
 
+    def marshal_json(self, __spec: t.Literal["base", "claude"]) -> bytes:
+        """
+        Get tool schema pre-serialized as JSON bytes. Serialization happens
+        once per spec; request builders assembling many tool schemas can
+        join the cached bytes instead of re-encoding dicts per call.
+        """
+        if (data := self._schemas_json.get(__spec)) is None:
+            data = self._schemas_json[__spec] = _json_dumps(self.marshal(__spec))
+        return data
+
     @t.overload
     def compile(self, __expression: str) -> t.Any:
         """
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import sys
 import typing as t
@@ -13,8 +14,6 @@ try:
 except ImportError:
     BaseModel, PydanticUndefined = None, None
 
-from . import exceptions
-
 NoneType = type(None)
 
 """
@@ -97,6 +96,10 @@ def extract_namespace(frame: FrameType | None):
     return NameSpace(globals=globalns, locals=localns or globalns)
 
 
+# Hoisted so each evaluation skips the method re-bind and frozenset allocation.
+_evaluate_ref = t.ForwardRef._evaluate
+_EMPTY_FROZENSET: t.FrozenSet[t.Any] = frozenset()
+
 if sys.version_info >= (3, 9):
 
     def evaluate_ref(__ref: t.ForwardRef, *, namespace: NameSpace) -> type:
@@ -106,7 +109,7 @@ if sys.version_info >= (3, 9):
         :param __ref: The ForwardRef typehint to evaluate.
         :param namespace: Associated namespace.
         """
-        return __ref._evaluate(namespace[0], namespace[1], recursive_guard=frozenset())  # type: ignore[return-value]
+        return _evaluate_ref(__ref, namespace[0], namespace[1], recursive_guard=_EMPTY_FROZENSET)  # type: ignore[return-value]
 else:
 
     def evaluate_ref(__ref: t.ForwardRef, *, namespace: NameSpace) -> type:
@@ -116,13 +119,26 @@ else:
         :param __ref: The ForwardRef typehint to evaluate.
         :param namespace: Associated namespace.
         """
-        return __ref._evaluate(namespace[0], namespace[1])  # type: ignore[return-value]
+        return _evaluate_ref(__ref, namespace[0], namespace[1])  # type: ignore[return-value]
+
+
+def _unwrap_tool(__resolved: t.Any) -> type:
+    from ._tool import tool
+
+    return __resolved._obj if isinstance(__resolved, tool) else __resolved  # type: ignore[return-value]
+
+
+_resolve_static_annotation = functools.lru_cache(maxsize=4096)(_unwrap_tool)
 
 
 def resolve_annotation(__annotation: str | type | t.ForwardRef, *, namespace: NameSpace) -> type:
     """
     Resolve an annotaion.
 
+    Non-ForwardRef annotations resolve independently of the namespace, so
+    their resolution is memoized; tool signatures repeat the same handful
+    of annotation objects across calls.
+
     :param __annotation: Annotation to resolve.
     :param namespace: Global and local nampespace for evaluating annotation.
     """
@@ -130,13 +146,12 @@ def resolve_annotation(__annotation: str | type | t.ForwardRef, *, namespace: Na
         __annotation = t.ForwardRef(arg=__annotation)
 
     if isinstance(__annotation, t.ForwardRef):
-        resolved = evaluate_ref(__annotation, namespace=namespace)
-    else:
-        resolved = __annotation
+        return _unwrap_tool(evaluate_ref(__annotation, namespace=namespace))
 
-    from ._tool import tool
-
-    return resolved._obj if isinstance(resolved, tool) else resolved  # type: ignore[return-value]
+    try:
+        return _resolve_static_annotation(__annotation)
+    except TypeError:  # unhashable annotation
+        return _unwrap_tool(__annotation)
 
 
 if sys.version_info >= (3, 10):
@@ -166,16 +181,43 @@ class AnnotationInfo(t.NamedTuple):
     is_optional: bool
 
 
+@functools.lru_cache(maxsize=4096)
+def _is_static_annotation(__annotation: t.Any) -> bool:
+    """
+    Check whether an annotation resolves independently of any namespace,
+    i.e. holds no forward reference anywhere in its argument tree.
+    """
+    if isinstance(__annotation, (str, t.ForwardRef)):
+        return False
+    return all(_is_static_annotation(arg) for arg in t.get_args(__annotation))
+
+
 def extract_annotation_info(
     __annotation: type | t.ForwardRef, *, namespace: NameSpace
 ) -> AnnotationInfo:
     """
     Extract info from annotation.
 
+    Namespace-independent annotations are memoized, collapsing the
+    get_origin/get_args walk to a cache probe on repeat extractions.
+
     :param __annotation: The annotation to extract info from.
     :param namespace: Global and local nampespace for evaluating annotation.
     :raises exceptions.UnsupportedTypeException: If the type is not supported.
     """
+    try:
+        if _is_static_annotation(__annotation):
+            return _static_annotation_info(__annotation)
+    except TypeError:  # unhashable annotation
+        pass
+    return _extract_annotation_info(__annotation, namespace)
+
+
+def _extract_annotation_info(
+    __annotation: type | t.ForwardRef, namespace: NameSpace
+) -> AnnotationInfo:
+    from . import exceptions  # deferred; only needed on error paths
+
     resolved = resolve_annotation(__annotation, namespace=namespace)
 
     is_optional = False
@@ -214,6 +256,16 @@ def extract_annotation_info(
     return AnnotationInfo(base_type=base_type, args=args, is_optional=is_optional)
 
 
+_EMPTY_NAMESPACE = NameSpace(globals=None, locals=None)
+
+
+def _extract_static_info(__annotation: t.Any) -> AnnotationInfo:
+    return _extract_annotation_info(__annotation, _EMPTY_NAMESPACE)
+
+
+_static_annotation_info = functools.lru_cache(maxsize=4096)(_extract_static_info)
+
+
 # Function-related definitions
 Function = t.TypeVar("Function", bound=t.Callable[..., t.Any])
 AsyncFunction = t.TypeVar("AsyncFunction", bound=t.Callable[..., t.Coroutine[t.Any, t.Any, t.Any]])
@@ -2,46 +2,98 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import copy
+import functools
 import inspect
 import json
+import sys
 import typing as t
+import weakref
 from enum import Enum
 from pathlib import Path
 from types import FrameType
 
+try:
+    from orjson import loads as _json_loads  # type: ignore[import-not-found]
+except ImportError:
+    _json_loads = json.loads
+
 from . import _types as ts
 from . import exceptions
 
-__all__ = "compile_value", "compile_object"
+__all__ = "compile_value", "compile_object", "compile_objects"
+
+
+def _has_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 
-def run_async(coro: t.Coroutine[t.Any, t.Any, t.Any]):
+def _run_on_running_loop(coro: t.Coroutine[t.Any, t.Any, t.Any]):
     """
-    Gets an existing event loop to run the coroutine.
-    If there is no existing event loop, creates a new one.
+    Run the coroutine on the already-running loop. Only a patched loop
+    (`import nest_asyncio; nest_asyncio.apply()`) can re-enter
+    `run_until_complete`; an unpatched one raises.
 
     :param coro: The coroutine to run.
 
-    :raises RuntimeError: If the event loop is already running and cannot be used
+    :raises RuntimeError: If the running loop is not patched for re-entry
     """
     try:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        try:
-            return asyncio.run(coro)
-        except RuntimeError as exc:
-            if "cannot be called from a running event loop" in str(exc):
-                raise RuntimeError(
-                    "The event loop is already running. "
-                    "Add `import nest_asyncio; nest_asyncio.apply()` to your code to fix this issue."
-                ) from exc
-            raise exc
-
-
-def parse_expression(__expression: str) -> t.Tuple[str, t.Dict[str, t.Any]]:
+        return asyncio.get_event_loop().run_until_complete(coro)
+    except RuntimeError as exc:
+        raise RuntimeError(
+            "The event loop is already running. "
+            "Add `import nest_asyncio; nest_asyncio.apply()` to your code to fix this issue."
+        ) from exc
+
+
+if sys.version_info >= (3, 11):
+    _runner: asyncio.Runner | None = None
+
+    def run_async(coro: t.Coroutine[t.Any, t.Any, t.Any]):
+        """
+        Runs the coroutine on a cached `asyncio.Runner`, creating it on first use.
+
+        :param coro: The coroutine to run.
+
+        :raises RuntimeError: If the event loop is already running and cannot be used
+        """
+        if _has_running_loop():
+            return _run_on_running_loop(coro)
+        global _runner
+        if _runner is None:
+            _runner = asyncio.Runner()
+        return _runner.run(coro)
+else:
+    _event_loop: asyncio.AbstractEventLoop | None = None
+
+    def run_async(coro: t.Coroutine[t.Any, t.Any, t.Any]):
+        """
+        Runs the coroutine on a cached event loop, creating one on first use.
+
+        :param coro: The coroutine to run.
+
+        :raises RuntimeError: If the event loop is already running and cannot be used
+        """
+        if _has_running_loop():
+            return _run_on_running_loop(coro)
+        global _event_loop
+        if _event_loop is None or _event_loop.is_closed():
+            _event_loop = asyncio.new_event_loop()
+        return _event_loop.run_until_complete(coro)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_expression(__expression: str) -> t.Tuple[str, t.Tuple[t.Any, ...], t.Dict[str, t.Any]]:
     """
-    Parse a call expression as metadata.
+    Parse a call expression into its name, positional and keyword arguments.
+
+    Memoized on the source string, since LLM output frequently repeats the
+    exact same call expression across a session.
 
     :param __expression: The expression to parse.
 
@@ -58,16 +110,80 @@ def parse_expression(__expression: str) -> t.Tuple[str, t.Dict[str, t.Any]]:
             return node.func.id, {"*args": args, **kwargs}  # type: ignore[attr-defined]
         try:
             return ast.literal_eval(node)
-        except NameError as err:
+        except (NameError, ValueError) as err:
             raise ValueError(f"Invalid input detected in signature: {__expression!r}") from err
 
     try:
-        call_node = ast.parse(__expression).body[0].value  # type: ignore[attr-defined]
+        call_node = ast.parse(__expression, mode="eval").body
     except SyntaxError as err:
         raise ValueError(f"Invalid syntax detected in call expression: {__expression!r}") from err
     if not isinstance(call_node, ast.Call):
         raise ValueError(f"{__expression!r} is not a valid call signature")
-    return eval_ast_node(call_node)
+    name, arguments = eval_ast_node(call_node)
+    return name, tuple(arguments.pop("*args")), arguments
+
+
+def parse_expression(__expression: str) -> t.Tuple[str, t.Dict[str, t.Any]]:
+    """
+    Parse a call expression as metadata.
+
+    :param __expression: The expression to parse.
+
+    :raises ValueError: If the input is invalid or not a valid call signature
+    """
+    name, pos_args, kwargs = _parse_expression(__expression)
+    # Deep-copy the cached values so callers may mutate any part of the
+    # arguments — including nested lists and dicts — without corrupting
+    # the cached entry.
+    return name, copy.deepcopy({"*args": list(pos_args), **kwargs})
+
+
+# Bounded so dynamically created tool functions are not pinned forever.
+_is_async = functools.lru_cache(maxsize=2048)(ts.is_async)
+
+_FIELD_CACHE: "weakref.WeakKeyDictionary[t.Any, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _resolved_fields(
+    __obj: t.Any,
+    namespace: ts.NameSpace,
+    resolve: t.Callable[[t.Any, ts.NameSpace], t.Iterator[tuple]],
+) -> t.Tuple[tuple, ...]:
+    """
+    Resolve the fields of an object once and memoize them per target.
+
+    Signature inspection and type-hint/annotation resolution are fixed by
+    the target object, not by the arguments, so repeat invocations of the
+    same tool reuse the first resolution instead of re-walking typing
+    internals. TypedDict and NamedTuple hints in particular are evaluated
+    exactly once per class.
+
+    :param __obj: The function or class whose fields to resolve.
+    :param namespace: Global and local nampespace for evaluating annotation.
+    :param resolve: Generator yielding per-field resolution tuples.
+    """
+    try:
+        fields = _FIELD_CACHE.get(__obj)
+    except TypeError:  # non-weakrefable target; resolve without caching
+        return tuple(resolve(__obj, namespace))
+    if fields is None:
+        fields = tuple(resolve(__obj, namespace))
+        _FIELD_CACHE[__obj] = fields
+    return fields
+
+
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+
+
+def _resolve_function_fields(__fn: ts.Function | ts.AsyncFunction, namespace: ts.NameSpace):
+    for key, param in ts.get_signature(__fn, namespace=namespace).parameters.items():
+        yield (
+            key,
+            ts.extract_annotation_info(param.annotation, namespace=namespace),
+            None if param.default is inspect._empty else param.default,
+            param.default is None,
+            param.kind is _POSITIONAL_ONLY,
+        )
 
 
 def compile_function_object(
@@ -82,32 +198,164 @@ def compile_function_object(
 
     :raises exceptions.RecursiveParameterException: If a required parameter is missing
     """
-    args, kwargs = [], {}
-    pos_args = arguments.pop("*args", [])
-    p_args_len = len(pos_args)
-    for idx, (key, param) in enumerate(
-        ts.get_signature(__fn, namespace=namespace).parameters.items()
-    ):
-        is_default_none = param.default is None
-        default = None if param.default is inspect._empty else param.default
-        raw_value = pos_args[idx] if idx + 1 <= p_args_len else arguments.get(key)
+    args, kwargs = _bind_function_arguments(__fn, arguments, namespace)
+    return run_async(__fn(*args, **kwargs)) if _is_async(__fn) else __fn(*args, **kwargs)
+
+
+async def compile_function_object_async(
+    __fn: ts.Function | ts.AsyncFunction, arguments: t.Dict[str, t.Any], namespace: ts.NameSpace
+):
+    """
+    Compile a function object with the given arguments, awaiting async functions
+    on the caller's event loop instead of spinning one up per call.
+
+    :param __fn: The function to compile.
+    :param arguments: The arguments to pass to the function.
+    :param namespace: Global and local nampespace for evaluating annotation.
+
+    :raises exceptions.RecursiveParameterException: If a required parameter is missing
+    """
+    args, kwargs = _bind_function_arguments(__fn, arguments, namespace)
+    result = __fn(*args, **kwargs)
+    return await result if _is_async(__fn) else result
 
-        annot_info = ts.extract_annotation_info(param.annotation, namespace=namespace)
-        value, is_optional = compile_value(annot_info, namespace, raw_value)
-        if value is None:
-            value = default
 
-        if not is_optional and value is None and not is_default_none:
+_BINDER_CACHE: "weakref.WeakKeyDictionary[t.Any, t.Callable]" = weakref.WeakKeyDictionary()
+
+
+def _codegen_function_binder(
+    __fn: ts.Function | ts.AsyncFunction, namespace: ts.NameSpace
+) -> t.Callable[[t.Dict[str, t.Any], ts.NameSpace], t.Tuple[list, dict]]:
+    """
+    Generate a straight-line binder turning raw arguments into `(args, kwargs)`.
+
+    Like `_codegen_typed_compiler`, the per-parameter loop is unrolled into
+    generated source with defaults and required checks specialized at
+    generation time; each call then runs plain sequential bytecode.
+
+    :param __fn: The function to generate a binder for.
+    :param namespace: Global and local nampespace for evaluating annotation.
+    """
+    scope: t.Dict[str, t.Any] = {
+        "_compile_value": _compile_value,
+        "_OPTIONAL_NONE": _OPTIONAL_NONE,
+        "exceptions": exceptions,
+    }
+    lines = [
+        "def _bind(arguments, namespace):",
+        "    pos_args = arguments.get('*args') or ()",
+        "    p = len(pos_args)",
+        "    get = arguments.get",
+    ]
+    positional, keyword = [], []
+    fields = _resolved_fields(__fn, namespace, _resolve_function_fields)
+    for idx, (key, annot_info, default, is_default_none, is_positional) in enumerate(fields):
+        scope[f"_info_{idx}"] = annot_info
+        lines.append(
+            f"    v{idx} = _compile_value("
+            f"_info_{idx}, namespace, pos_args[{idx}] if {idx} < p else get({key!r}))"
+        )
+        if default is not None:
+            scope[f"_default_{idx}"] = default
+            lines.append(f"    if v{idx} is _OPTIONAL_NONE or v{idx} is None:")
+            lines.append(f"        v{idx} = _default_{idx}")
+        elif is_default_none:
+            lines.append(f"    if v{idx} is _OPTIONAL_NONE:")
+            lines.append(f"        v{idx} = None")
+        else:
+            lines += [
+                f"    if v{idx} is _OPTIONAL_NONE:",
+                f"        v{idx} = None",
+                f"    elif v{idx} is None:",
+                "        raise exceptions.RecursiveParameterException(",
+                f"            label={key!r}, type_base='function', "
+                f"type_name={__fn.__name__!r}",
+                "        )",
+            ]
+        (positional if is_positional else keyword).append(idx)
+
+    arg_list = ", ".join(f"v{idx}" for idx in positional)
+    kwarg_items = ", ".join(f"{fields[idx][0]!r}: v{idx}" for idx in keyword)
+    lines.append(f"    return [{arg_list}], {{{kwarg_items}}}")
+
+    exec(compile("\n".join(lines), "<tool_parse codegen>", "exec"), scope)  # noqa: S102
+    return scope["_bind"]
+
+
+def _bind_function_arguments(
+    __fn: ts.Function | ts.AsyncFunction, arguments: t.Dict[str, t.Any], namespace: ts.NameSpace
+):
+    try:
+        binder = _BINDER_CACHE.get(__fn)
+    except TypeError:  # non-weakrefable target; generate without caching
+        return _codegen_function_binder(__fn, namespace)(arguments, namespace)
+    if binder is None:
+        binder = _codegen_function_binder(__fn, namespace)
+        _BINDER_CACHE[__fn] = binder
+    return binder(arguments, namespace)
+
+
+def _resolve_pydantic_fields(__model: type[ts.PydanticModel], namespace: ts.NameSpace):
+    for label, field in __model.model_fields.items():
+        annot_info = ts.extract_annotation_info(field.annotation, namespace=namespace)
+        if annot_info[0] is __model or __model in annot_info[1]:
             raise exceptions.RecursiveParameterException(
-                label=key, type_base="function", type_name=__fn.__name__
+                label=label, type_base="pydantic model", type_name=__model.__name__
             )
+        yield label, annot_info, field.default, field.is_required()
+
+
+def _codegen_pydantic_compiler(
+    __model: type[ts.PydanticModel], namespace: ts.NameSpace
+) -> t.Callable[[t.Dict[str, t.Any], ts.NameSpace], ts.PydanticModel]:
+    """
+    Generate a straight-line compiler function for a Pydantic model.
 
-        if param.kind is inspect._ParameterKind.POSITIONAL_ONLY:
-            args.append(value)
+    Whether each field has a usable default and whether it is required are
+    known from the model definition, so those branches are decided here at
+    generation time rather than re-evaluated per call.
+
+    :param __model: The Pydantic model to generate a compiler for.
+    :param namespace: Global and local nampespace for evaluating annotation.
+    """
+    scope: t.Dict[str, t.Any] = {
+        "_compile_value": _compile_value,
+        "_OPTIONAL_NONE": _OPTIONAL_NONE,
+        "exceptions": exceptions,
+        "_ctor": __model,
+    }
+    lines = ["def _compiled(arguments, namespace):", "    get = arguments.get", "    fields = {}"]
+    for idx, (label, annot_info, default, is_required) in enumerate(
+        _resolved_fields(__model, namespace, _resolve_pydantic_fields)
+    ):
+        scope[f"_info_{idx}"] = annot_info
+        lines.append(f"    value = _compile_value(_info_{idx}, namespace, get({label!r}))")
+        if default not in (None, ts.PydanticUndefined):
+            scope[f"_default_{idx}"] = default
+            lines += [
+                "    if value is _OPTIONAL_NONE or value is None:",
+                f"        value = _default_{idx}",
+            ]
+        elif is_required:
+            lines += [
+                "    if value is _OPTIONAL_NONE:",
+                "        value = None",
+                "    elif value is None:",
+                "        raise exceptions.RequiredParameterException(",
+                f"            label={label!r}, type_base='pydantic model', "
+                f"type_name={__model.__name__!r}",
+                "        )",
+            ]
         else:
-            kwargs[key] = value
+            lines += [
+                "    if value is _OPTIONAL_NONE:",
+                "        value = None",
+            ]
+        lines.append(f"    fields[{label!r}] = value")
+    lines.append("    return _ctor(**fields)")
 
-    return run_async(__fn(*args, **kwargs)) if ts.is_async(__fn) else __fn(*args, **kwargs)
+    exec(compile("\n".join(lines), "<tool_parse codegen>", "exec"), scope)  # noqa: S102
+    return scope["_compiled"]
 
 
 def compile_pydantic_object(
@@ -122,32 +370,103 @@ def compile_pydantic_object(
 
     :raises exceptions.RequiredParameterException: If a required field is missing
     """
-    name, fields = __model.__name__, {}
-    for label, field in __model.model_fields.items():
-        annot_info = ts.extract_annotation_info(field.annotation, namespace=namespace)
-        if annot_info[0] is __model or __model in annot_info[1]:
+    try:
+        compiled = _TYPED_COMPILER_CACHE.get(__model)
+    except TypeError:  # non-weakrefable target; generate without caching
+        return _codegen_pydantic_compiler(__model, namespace)(arguments, namespace)
+    if compiled is None:
+        compiled = _codegen_pydantic_compiler(__model, namespace)
+        _TYPED_COMPILER_CACHE[__model] = compiled
+    return compiled(arguments, namespace)
+
+
+_MISSING = object()
+
+
+def _resolve_typed_fields(
+    __typed_obj: type, namespace: ts.NameSpace, defaults: t.Mapping[str, t.Any], type_base: str
+):
+    for label, annotation in __typed_obj.__annotations__.items():
+        annot_info = ts.extract_annotation_info(annotation, namespace=namespace)
+        if annot_info[0] is __typed_obj or __typed_obj in annot_info[1]:
             raise exceptions.RecursiveParameterException(
-                label=label, type_base="pydantic model", type_name=__model.__name__
+                label=label, type_base=type_base, type_name=__typed_obj.__name__
             )
-        value, is_optional = compile_value(annot_info, namespace, arguments.get(label))
-        if value is None and field.default not in (None, ts.PydanticUndefined):
-            value = field.default
+        yield label, annot_info, defaults.get(label, _MISSING)
+
+
+def _resolve_typeddict_fields(__td: type[ts.TypedDict], namespace: ts.NameSpace):
+    defaults = {
+        label: getattr(__td, label) for label in __td.__annotations__ if hasattr(__td, label)
+    }
+    yield from _resolve_typed_fields(__td, namespace, defaults, "TypedDict")
 
-        if not is_optional and value is None and field.is_required():
-            raise exceptions.RequiredParameterException(
-                label=label, type_base="pydantic model", type_name=name
-            )
-        fields[label] = value
 
-    return __model(**fields)
+def _resolve_namedtuple_fields(__nt: type[ts.NamedTuple], namespace: ts.NameSpace):
+    yield from _resolve_typed_fields(__nt, namespace, __nt._field_defaults, "NamedTuple")
+
+
+_TYPED_COMPILER_CACHE: "weakref.WeakKeyDictionary[t.Any, t.Callable]" = weakref.WeakKeyDictionary()
+
+
+def _codegen_typed_compiler(
+    __typed_obj: type,
+    namespace: ts.NameSpace,
+    resolve: t.Callable[[t.Any, ts.NameSpace], t.Iterator[tuple]],
+    type_base: str,
+) -> t.Callable[[t.Dict[str, t.Any], ts.NameSpace], t.Any]:
+    """
+    Generate a straight-line compiler function for a typed object.
+
+    The per-field loop, default probes and required checks are unrolled
+    into generated source specialized on the resolved fields, so repeat
+    compilations of the same class run plain sequential bytecode.
+
+    :param __typed_obj: The typed object to generate a compiler for.
+    :param namespace: Global and local nampespace for evaluating annotation.
+    :param resolve: Generator yielding per-field resolution tuples.
+    :param type_base: The base type of the object.
+    """
+    scope: t.Dict[str, t.Any] = {
+        "_compile_value": _compile_value,
+        "_OPTIONAL_NONE": _OPTIONAL_NONE,
+        "exceptions": exceptions,
+        "_ctor": __typed_obj,
+    }
+    lines = ["def _compiled(arguments, namespace):", "    get = arguments.get", "    fields = {}"]
+    for idx, (label, annot_info, default) in enumerate(
+        _resolved_fields(__typed_obj, namespace, resolve)
+    ):
+        scope[f"_info_{idx}"] = annot_info
+        lines.append(f"    value = _compile_value(_info_{idx}, namespace, get({label!r}))")
+        if default is _MISSING:
+            lines += [
+                "    if value is _OPTIONAL_NONE:",
+                "        value = None",
+                "    elif value is None:",
+                "        raise exceptions.RequiredParameterException(",
+                f"            label={label!r}, type_base={type_base!r}, "
+                f"type_name={__typed_obj.__name__!r}",
+                "        )",
+            ]
+        else:
+            scope[f"_default_{idx}"] = default
+            lines += [
+                "    if value is _OPTIONAL_NONE or value is None:",
+                f"        value = _default_{idx}",
+            ]
+        lines.append(f"    fields[{label!r}] = value")
+    lines.append("    return _ctor(**fields)")
+
+    exec(compile("\n".join(lines), "<tool_parse codegen>", "exec"), scope)  # noqa: S102
+    return scope["_compiled"]
 
 
 def _compile_typed_object(
     __typed_obj: type,
     arguments: t.Dict[str, t.Any],
     namespace: ts.NameSpace,
-    has_default: t.Callable[[str], bool],
-    get_default: t.Callable[[str], t.Any],
+    resolve: t.Callable[[t.Any, ts.NameSpace], t.Iterator[tuple]],
     type_base: str,
 ):
     """
@@ -156,29 +475,21 @@ def _compile_typed_object(
     :param __typed_obj: The typed object to compile.
     :param arguments: The arguments to pass to the object.
     :param namespace: Global and local nampespace for evaluating annotation.
-    :param has_default: Function to check if a field has a default value.
-    :param get_default: Function to get the default value of a field.
+    :param resolve: Generator yielding per-field resolution tuples.
     :param type_base: The base type of the object.
 
     :raises exceptions.RequiredParameterException: If a required field is missing
     """
-    name, fields = __typed_obj.__name__, {}
-    for label, annotation in __typed_obj.__annotations__.items():
-        annot_info = ts.extract_annotation_info(annotation, namespace=namespace)
-        if annot_info[0] is __typed_obj or __typed_obj in annot_info[1]:
-            raise exceptions.RecursiveParameterException(
-                label=label, type_base=type_base, type_name=name
-            )
-
-        value, is_optional = compile_value(annot_info, namespace, arguments.get(label))
-        if not is_optional and value is None and not has_default(label):
-            raise exceptions.RequiredParameterException(
-                label=label, type_base=type_base, type_name=name
-            )
-
-        fields[label] = get_default(label) if value is None else value
-
-    return __typed_obj(**fields)
+    try:
+        compiled = _TYPED_COMPILER_CACHE.get(__typed_obj)
+    except TypeError:  # non-weakrefable target; generate without caching
+        return _codegen_typed_compiler(__typed_obj, namespace, resolve, type_base)(
+            arguments, namespace
+        )
+    if compiled is None:
+        compiled = _codegen_typed_compiler(__typed_obj, namespace, resolve, type_base)
+        _TYPED_COMPILER_CACHE[__typed_obj] = compiled
+    return compiled(arguments, namespace)
 
 
 def compile_typeddict_object(
@@ -192,12 +503,7 @@ def compile_typeddict_object(
     :param namespace: Global and local nampespace for evaluating annotation.
     """
     return _compile_typed_object(
-        __td,
-        arguments=arguments,
-        namespace=namespace,
-        has_default=lambda key: hasattr(__td, key),
-        get_default=lambda key: getattr(__td, key, None),
-        type_base="TypedDict",
+        __td, arguments, namespace, _resolve_typeddict_fields, "TypedDict"
     )
 
 
@@ -212,106 +518,374 @@ def compile_namedtuple_object(
     :param namespace: Global and local nampespace for evaluating annotation.
     """
     return _compile_typed_object(
-        __nt,
-        arguments=arguments,
-        namespace=namespace,
-        has_default=lambda key: key in __nt._field_defaults,
-        get_default=lambda key: __nt._field_defaults.get(key),
-        type_base="NamedTuple",
+        __nt, arguments, namespace, _resolve_namedtuple_fields, "NamedTuple"
     )
 
 
-def _get_obj_compiler(__obj: t.Any, check_fn: bool = False):
+_OBJ_COMPILERS = (
+    compile_pydantic_object,
+    compile_typeddict_object,
+    compile_namedtuple_object,
+    compile_function_object,
+)
+
+
+def _classify_uncached(__obj: t.Any) -> int:
     if ts.is_pydantic_model(__obj):
-        return compile_pydantic_object
-    elif ts.is_typeddict(__obj):
-        return compile_typeddict_object
-    elif ts.is_namedtuple(__obj):
-        return compile_namedtuple_object
-    elif inspect.isfunction(__obj) and check_fn:
-        return compile_function_object
+        return 0
+    if ts.is_typeddict(__obj):
+        return 1
+    if ts.is_namedtuple(__obj):
+        return 2
+    if inspect.isfunction(__obj):
+        return 3
+    return -1
 
 
-def compile_value(  # noqa: C901
-    __info: ts.AnnotationInfo, namespace: ts.NameSpace, raw_value: t.Optional[t.Any]
-) -> t.Tuple[t.Optional[t.Any], bool]:
-    """
-    Compile the raw value based on the given annotation info.
+# Bounded so dynamically created tool objects are not pinned forever.
+_classify_cached = functools.lru_cache(maxsize=2048)(_classify_uncached)
 
-    :param __info: The annotation info to use for compiling.
-    :param namespace: Global and local nampespace for evaluating annotation.
-    :param raw_value: The raw value to compile.
 
-    :raises exceptions.TypeMismatchException: If the raw value doesn't match the expected type
-    :raises exceptions.InvalidArgumentException: If the argument is invalid for Literal or Enum types
-    :raises exceptions.UnsupportedTypeException: If the type is not supported
+def _classify(__obj: t.Any) -> int:
     """
-    _type, args, is_optional = __info
+    Classify an object into an index of `_OBJ_COMPILERS`, or -1 if unsupported.
 
-    if raw_value is None:
-        return None, is_optional
+    Memoized so repeat compilations of the same tool skip the predicate chain.
+    """
+    try:
+        return _classify_cached(__obj)
+    except TypeError:  # unhashable object; classify without caching
+        return _classify_uncached(__obj)
 
-    type_repr = ts.get_type_repr(_type)
-    raw_value_type = ts.get_type_repr(type(raw_value))
 
-    def validate(e_type: type, t_type_repr: str | None = type_repr):
-        nonlocal raw_value
+def _get_obj_compiler(__obj: t.Any, check_fn: bool = False):
+    kind = _classify(__obj)
+    if kind < 0 or (kind == 3 and not check_fn):
+        return None
+    return _OBJ_COMPILERS[kind]
+
+
+def _build_validator(e_type: type, t_type_repr: str | None):
+    """
+    Build a validator closure that checks a raw value against an expected type,
+    coercing str/float/int values when possible.
+
+    :param e_type: The expected type of the raw value.
+    :param t_type_repr: Representation of the target type, used in error messages.
+    """
+    e_type_repr = ts.get_type_repr(e_type)
+    coercible = e_type in (str, float, int)
+    is_numeric = e_type in (float, int)
+
+    def validate(raw_value: t.Any):
+        # JSON produces exact builtin types, so the identity check wins
+        # before falling back to a full isinstance for subclasses.
+        if type(raw_value) is e_type or isinstance(raw_value, e_type):
+            return raw_value
         exc = exceptions.TypeMismatchException(
-            expected_type_repr=ts.get_type_repr(e_type),
+            expected_type_repr=e_type_repr,
             target_type_repr=t_type_repr,
-            received_type_repr=raw_value_type,
+            received_type_repr=ts.get_type_repr(type(raw_value)),
         )
-        if isinstance(raw_value, e_type):
-            return
-        if e_type not in (str, float, int):
+        if not coercible:
             raise exc
+        if is_numeric and isinstance(raw_value, str):
+            # Precheck plain numeric strings so well-formed values convert
+            # without an exception frame and malformed ones fail fast.
+            body = raw_value[1:] if raw_value[:1] in "+-" else raw_value
+            if e_type is float:
+                body = body.replace(".", "", 1)
+            if body.isdecimal():
+                return e_type(raw_value)
         try:
-            raw_value = e_type(raw_value)
+            return e_type(raw_value)
         except ValueError as err:
             raise exc from err
 
+    return validate
+
+
+def _primitive_handler(__type: type):
+    validate = _build_validator(__type, t_type_repr=None)
+
+    def compile_primitive(raw_value: t.Any, namespace: ts.NameSpace):
+        return validate(raw_value)
+
+    return compile_primitive
+
+
+def _path_handler(__type: type):
+    validate = _build_validator(str, t_type_repr=ts.get_type_repr(__type))
+
+    def compile_path(raw_value: t.Any, namespace: ts.NameSpace):
+        return __type(validate(raw_value))
+
+    return compile_path
+
+
+"""
+Handlers for common concrete annotations, built once at import time so
+`_build_compiler` resolves them with a single dict probe instead of
+walking the dispatch cascade.
+"""
+_TYPE_HANDLERS: t.Dict[type, t.Callable[[t.Any, ts.NameSpace], t.Any]] = {
+    str: _primitive_handler(str),
+    int: _primitive_handler(int),
+    float: _primitive_handler(float),
+    bool: _primitive_handler(bool),
+    dict: _primitive_handler(dict),
+    list: _primitive_handler(list),
+    set: _primitive_handler(set),
+    Path: _path_handler(Path),
+}
+
+
+def _build_compiler(  # noqa: C901
+    _type: type, args: t.Tuple[t.Any, ...]
+) -> t.Callable[[t.Any, ts.NameSpace], t.Any]:
+    """
+    Build a compiler closure specialized for the given annotation.
+
+    The dispatch cascade over Literal / list / Path / Enum / primitive /
+    structured types is fixed by the annotation, not by the value, so it is
+    run once here and the returned closure only does the per-value work.
+
+    :param _type: The base type of the annotation.
+    :param args: The type arguments of the annotation.
+
+    :raises exceptions.UnsupportedTypeException: If the type is not supported
+    """
+    if not args and (handler := _TYPE_HANDLERS.get(_type)) is not None:
+        return handler
+
+    type_repr = ts.get_type_repr(_type)
+
+    def build_validator(e_type: type, t_type_repr: str | None = type_repr):
+        return _build_validator(e_type, t_type_repr)
+
     if args:
         if _type is t.Literal:
-            validate(type(args[0]))
-            if raw_value not in args:
-                raise exceptions.InvalidArgumentException(
-                    arg=raw_value, type_base="Literal", valid_args=args
-                )
-            return raw_value, is_optional
+            validate_literal = build_validator(type(args[0]))
+
+            def compile_literal(raw_value: t.Any, namespace: ts.NameSpace):
+                raw_value = validate_literal(raw_value)
+                if raw_value not in args:
+                    raise exceptions.InvalidArgumentException(
+                        arg=raw_value, type_base="Literal", valid_args=list(args)
+                    )
+                return raw_value
+
+            return compile_literal
 
         if _type in (list, set, t.List, t.Set):
-            validate(list)
-            cast = list if _type in (list, t.List) else set
-            arg_info = ts.extract_annotation_info(args[0], namespace=namespace)
-            return cast(compile_value(arg_info, namespace, v)[0] for v in raw_value), is_optional
+            validate_sequence = build_validator(list)
+            element_annotation = args[0]
+
+            if _type in (list, t.List):
+
+                def compile_list(raw_value: t.Any, namespace: ts.NameSpace):
+                    raw_value = validate_sequence(raw_value)
+                    element_info = ts.extract_annotation_info(
+                        element_annotation, namespace=namespace
+                    )
+                    e_type, e_args, _ = element_info
+                    # Homogeneous primitive lists pass through unchanged;
+                    # the C-level scan beats a per-element compile call.
+                    if (
+                        not e_args
+                        and e_type in _EXACT_TYPE_FAST
+                        and all(type(v) is e_type for v in raw_value)
+                    ):
+                        return raw_value
+                    return [
+                        None
+                        if (c := _compile_value(element_info, namespace, v)) is _OPTIONAL_NONE
+                        else c
+                        for v in raw_value
+                    ]
+
+                return compile_list
+
+            def compile_set(raw_value: t.Any, namespace: ts.NameSpace):
+                raw_value = validate_sequence(raw_value)
+                element_info = ts.extract_annotation_info(element_annotation, namespace=namespace)
+                return {
+                    None
+                    if (c := _compile_value(element_info, namespace, v)) is _OPTIONAL_NONE
+                    else c
+                    for v in raw_value
+                }
+
+            return compile_set
 
     if ts.check_subclass(_type, Path):
-        validate(str)
-        return _type(raw_value), is_optional
+        validate_path = build_validator(str)
+
+        def compile_path(raw_value: t.Any, namespace: ts.NameSpace):
+            return _type(validate_path(raw_value))
+
+        return compile_path
 
     if ts.check_subclass(_type, Enum):
-        validate(str)
-        if (enum := _type._member_map_.get(raw_value)) is None:
-            raise exceptions.InvalidArgumentException(
-                arg=raw_value, type_base=f"{_type.__name__} Enum", valid_args=_type._member_names_
-            )
-        return enum, is_optional
+        validate_enum = build_validator(str)
+        get_member = _type._member_map_.get
+        member_names = _type._member_names_
+        enum_type_base = f"{_type.__name__} Enum"
+
+        def compile_enum(raw_value: t.Any, namespace: ts.NameSpace):
+            raw_value = validate_enum(raw_value)
+            if (enum := get_member(raw_value)) is None:
+                raise exceptions.InvalidArgumentException(
+                    arg=raw_value, type_base=enum_type_base, valid_args=member_names
+                )
+            return enum
+
+        return compile_enum
 
     if _type in ts._SUPPORTED_TYPE_MAP:
-        validate(_type, t_type_repr=None)
-        return raw_value, is_optional
+        validate_primitive = build_validator(_type, t_type_repr=None)
+
+        def compile_primitive(raw_value: t.Any, namespace: ts.NameSpace):
+            return validate_primitive(raw_value)
+
+        return compile_primitive
 
     if (compile_fn := _get_obj_compiler(_type)) is not None:
-        validate(dict)
-        return compile_fn(_type, raw_value, namespace), is_optional
+        validate_structured = build_validator(dict)
+
+        def compile_structured(raw_value: t.Any, namespace: ts.NameSpace):
+            return compile_fn(_type, validate_structured(raw_value), namespace)
+
+        return compile_structured
 
     raise exceptions.UnsupportedTypeException(
         type_hint_repr=type_repr, supported_repr=ts._SUPPORTED_TYPES_REPR
     )
 
 
+# Bounded so dynamically created annotation types (Enums, models,
+# TypedDicts) captured by the compiled closures are not pinned forever.
+_cached_compiler = functools.lru_cache(maxsize=2048)(_build_compiler)
+
+_EXACT_TYPE_FAST = frozenset((int, str, float, bool, dict, list, set))
+
+
+_OPTIONAL_NONE = object()
+"""Sentinel returned by `_compile_value` for an absent value whose annotation is optional."""
+
+
+def _compile_value(
+    __info: ts.AnnotationInfo,
+    namespace: ts.NameSpace,
+    raw_value: t.Optional[t.Any],
+    # Default-bound so the hot path loads these as locals, not globals.
+    _type_of=type,
+    _exact_types=_EXACT_TYPE_FAST,
+    _tuple=tuple,
+):
+    """
+    Compile the raw value based on the given annotation info.
+
+    Returns the compiled value, `None` for an absent required value, or the
+    `_OPTIONAL_NONE` sentinel for an absent optional one — avoiding the
+    `(value, is_optional)` tuple allocation on every (possibly recursive) call.
+
+    :param __info: The annotation info to use for compiling.
+    :param namespace: Global and local nampespace for evaluating annotation.
+    :param raw_value: The raw value to compile.
+
+    :raises exceptions.TypeMismatchException: If the raw value doesn't match the expected type
+    :raises exceptions.InvalidArgumentException: If the argument is invalid for Literal or Enum types
+    :raises exceptions.UnsupportedTypeException: If the type is not supported
+    """
+    _type, args, is_optional = __info
+
+    # Dominant case: a value already of its exact annotated type. Bare
+    # containers qualify too, but parameterized ones (non-empty args) must
+    # still compile their elements.
+    if _type_of(raw_value) is _type and not args and _type in _exact_types:
+        return raw_value
+
+    if raw_value is None:
+        return _OPTIONAL_NONE if is_optional else None
+
+    try:
+        compiler = _cached_compiler(_type, _tuple(args))
+    except TypeError:  # unhashable annotation; build without caching
+        compiler = _build_compiler(_type, _tuple(args))
+    return compiler(raw_value, namespace)
+
+
+def compile_value(
+    __info: ts.AnnotationInfo, namespace: ts.NameSpace, raw_value: t.Optional[t.Any]
+) -> t.Tuple[t.Optional[t.Any], bool]:
+    """
+    Compile the raw value based on the given annotation info.
+
+    :param __info: The annotation info to use for compiling.
+    :param namespace: Global and local nampespace for evaluating annotation.
+    :param raw_value: The raw value to compile.
+
+    :raises exceptions.TypeMismatchException: If the raw value doesn't match the expected type
+    :raises exceptions.InvalidArgumentException: If the argument is invalid for Literal or Enum types
+    :raises exceptions.UnsupportedTypeException: If the type is not supported
+    """
+    value = _compile_value(__info, namespace, raw_value)
+    if value is _OPTIONAL_NONE:
+        return None, True
+    return value, __info[2]
+
+
+def _has_forward_ref(__annotation: t.Any, __seen: t.FrozenSet[type] = frozenset()) -> bool:
+    if isinstance(__annotation, (str, t.ForwardRef)):
+        return True
+    if args := t.get_args(__annotation):
+        return any(_has_forward_ref(arg, __seen) for arg in args)
+    if not isinstance(__annotation, type) or __annotation in __seen:
+        return False
+    kind = _classify(__annotation)
+    if kind == 0:
+        children: t.Iterable[t.Any] = (
+            field.annotation for field in __annotation.model_fields.values()
+        )
+    elif kind in (1, 2):
+        children = __annotation.__annotations__.values()
+    else:
+        return False
+    seen = __seen | {__annotation}
+    return any(_has_forward_ref(child, seen) for child in children)
+
+
+def _needs_namespace_uncached(__obj: t.Any) -> bool:
+    if inspect.isfunction(__obj):
+        return any(_has_forward_ref(a) for a in __obj.__annotations__.values())
+    return _has_forward_ref(__obj)
+
+
+# Bounded so dynamically created tool objects are not pinned forever.
+_needs_namespace_cached = functools.lru_cache(maxsize=2048)(_needs_namespace_uncached)
+
+
+def _needs_namespace(__obj: t.Any) -> bool:
+    """
+    Check whether compiling an object requires the caller's namespace,
+    i.e. whether any annotation in its signature holds a forward reference.
+    """
+    try:
+        return _needs_namespace_cached(__obj)
+    except TypeError:  # unhashable object; check without caching
+        return _needs_namespace_uncached(__obj)
+
+
+_EMPTY_NAMESPACE = ts.NameSpace(globals=None, locals=None)
+
+
 def compile_object(
-    __obj: t.Any, *, arguments: t.Optional[str | t.Dict[str, t.Any]], frame: FrameType | None = None
+    __obj: t.Any,
+    *,
+    arguments: t.Optional[str | t.Dict[str, t.Any]],
+    frame: FrameType | None = None,
+    namespace: ts.NameSpace | None = None,
 ):
     """
     Compile an object with the given arguments.
@@ -319,16 +893,74 @@ def compile_object(
     :param __obj: The object to compile.
     :param arguments: The arguments to pass to the object.
     :param frame: The frame to extract global and local namespaces from.
+    :param namespace: Pre-extracted namespace, taking precedence over `frame`.
 
     :raises ValueError: If the arguments are not a valid JSON object or if the object type is not supported
     """
-    if isinstance(arguments, str):
+    compile_fn, arguments, namespace = _prepare_compile(__obj, arguments, frame, namespace)
+    return compile_fn(__obj, arguments, namespace)
+
+
+def _prepare_compile(
+    __obj: t.Any,
+    arguments: t.Optional[str | bytes | t.Dict[str, t.Any]],
+    frame: FrameType | None,
+    namespace: ts.NameSpace | None = None,
+):
+    if isinstance(arguments, (str, bytes)):
         try:
-            arguments: t.Dict[str, t.Any] = json.loads(arguments)  # type: ignore[no-redef]
-        except json.JSONDecodeError as err:
+            arguments = _json_loads(arguments)
+        except ValueError as err:
             raise ValueError("arguments is not a valid JSON object") from err
 
     if (compile_fn := _get_obj_compiler(__obj, check_fn=True)) is None:
         raise ValueError("Tool invocation failed, given object is not supported")
 
-    return compile_fn(__obj, arguments, ts.extract_namespace(frame))
+    if namespace is None:
+        # Extracting a namespace merges the caller's frame locals into a
+        # fresh dict; skip it entirely for fully-concrete signatures.
+        namespace = ts.extract_namespace(frame) if _needs_namespace(__obj) else _EMPTY_NAMESPACE
+    return compile_fn, arguments, namespace
+
+
+async def compile_object_async(
+    __obj: t.Any, *, arguments: t.Optional[str | t.Dict[str, t.Any]], frame: FrameType | None = None
+):
+    """
+    Compile an object with the given arguments, awaiting async functions
+    instead of running them to completion on a private loop.
+
+    :param __obj: The object to compile.
+    :param arguments: The arguments to pass to the object.
+    :param frame: The frame to extract global and local namespaces from.
+
+    :raises ValueError: If the arguments are not a valid JSON object or if the object type is not supported
+    """
+    compile_fn, arguments, namespace = _prepare_compile(__obj, arguments, frame)
+    if compile_fn is compile_function_object:
+        return await compile_function_object_async(__obj, arguments, namespace)
+    return compile_fn(__obj, arguments, namespace)
+
+
+def compile_objects(
+    __batch: t.Iterable[t.Tuple[t.Any, t.Optional[str | t.Dict[str, t.Any]]]],
+    *,
+    frame: FrameType | None = None,
+):
+    """
+    Compile a batch of objects concurrently. Async functions are gathered on a
+    single event loop so their I/O overlaps, instead of each one serializing
+    through its own `run_until_complete` entry.
+
+    :param __batch: Iterable of `(object, arguments)` pairs to compile.
+    :param frame: The frame to extract global and local namespaces from.
+
+    :raises ValueError: If any arguments are not a valid JSON object or an object type is not supported
+    """
+
+    async def gather():
+        return await asyncio.gather(
+            *(compile_object_async(obj, arguments=args, frame=frame) for obj, args in __batch)
+        )
+
+    return run_async(gather())
@@ -5,6 +5,7 @@ Extended tool support for langchain-based integration.
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import sys
 import typing as t
@@ -45,6 +46,19 @@ from ..compile import compile_object
 from ..marshal import marshal_object
 
 
+@functools.lru_cache(maxsize=2048)
+def _accepts_run_manager(__fn: t.Callable) -> bool:
+    """
+    Check once per underlying function whether it takes a `run_manager`
+    parameter; `run`/`arun` previously re-inspected the signature per call.
+    Bounded so dynamically created tool functions are not pinned forever.
+    """
+    return inspect.signature(__fn).parameters.get("run_manager") is not None
+
+
+_runnable_config_param = functools.lru_cache(maxsize=2048)(_get_runnable_config_param)
+
+
 class ExtendedStructuredTool(BaseTool):
     name: t.Optional[str] = None
     """The unique name of the tool that clearly communicates its purpose."""
@@ -59,16 +73,21 @@ class ExtendedStructuredTool(BaseTool):
     """
     schema_spec: t.Literal["base", "claude"] = "base"
     """Schema spec to use. `base` works with most of the LLM."""
+    tool_schema: t.Optional[dict] = None
+    """Pre-marshaled schema for `func`; when provided, marshaling is skipped."""
     _schema: dict = PrivateAttr
+    _args: dict = PrivateAttr
+    _namespace: ts.NameSpace = PrivateAttr
 
     @model_validator(mode="after")
     def validate_name_and_description(self):
-        tool_schema = marshal_object(
+        frame = sys._getframe(1)
+        tool_schema = self.tool_schema or marshal_object(
             self.func,
             spec=self.schema_spec,
             name=self.name,
             description=self.description,
-            frame=sys._getframe(1),
+            frame=frame,
         )
         if not self.name:
             self.name = tool_schema["function"]["name"]
@@ -79,6 +98,11 @@ class ExtendedStructuredTool(BaseTool):
             self.description = fn_desc
 
         self._schema = tool_schema
+        p_key = "parameters" if self.schema_spec == "base" else "input_schema"
+        self._args = tool_schema["function"][p_key]["properties"]
+        # Annotation scope is fixed here; snapshot it so each tool run
+        # skips frame materialization.
+        self._namespace = ts.extract_namespace(frame)
         return self
 
     @classmethod
@@ -99,7 +123,19 @@ class ExtendedStructuredTool(BaseTool):
         :param schema_spec: Schema spec to use. `base` works with most of the LLM.
         :returns: list of tools.
         """
-        return [cls(func=obj, schema_spec=schema_spec, **kwargs) for obj in __objs]
+        # Marshal here with the caller's frame — the validator only sees
+        # pydantic's frame — and once per unique object when repeated.
+        frame = sys._getframe(1)
+        name, description = kwargs.get("name"), kwargs.get("description")
+        schemas: t.Dict[t.Any, ts.ToolSchema] = {}
+        tools = []
+        for obj in __objs:
+            if (schema := schemas.get(obj)) is None:
+                schema = schemas[obj] = marshal_object(
+                    obj, spec=schema_spec, name=name, description=description, frame=frame
+                )
+            tools.append(cls(func=obj, schema_spec=schema_spec, tool_schema=schema, **kwargs))
+        return tools
 
     # --- Runnable ---
 
@@ -123,9 +159,8 @@ class ExtendedStructuredTool(BaseTool):
 
     @property
     def args(self) -> t.Dict[str, t.Any]:
-        """The tool's input arguments."""
-        p_key = "parameters" if self.schema_spec == "base" else "input_schema"
-        return self.json_schema["function"][p_key]["properties"]  # type: ignore[literal-required]
+        """The tool's input arguments, resolved once at validation time."""
+        return self._args
 
     def _run(
         self,
@@ -137,10 +172,10 @@ class ExtendedStructuredTool(BaseTool):
         """Use the tool."""
         if run_manager and self.args.get("callbacks"):
             kwargs["callbacks"] = run_manager.get_child()
-        if config_param := _get_runnable_config_param(self.func):
+        if config_param := _runnable_config_param(self.func):
             kwargs[config_param] = config
 
-        return compile_object(self.func, arguments=kwargs, frame=sys._getframe(1))
+        return compile_object(self.func, arguments=kwargs, namespace=self._namespace)
 
     async def _arun(
         self,
@@ -153,10 +188,10 @@ class ExtendedStructuredTool(BaseTool):
         if inspect.iscoroutinefunction(self.func):
             if run_manager and self.args.get("callbacks"):
                 kwargs["callbacks"] = run_manager.get_child()
-            if config_param := _get_runnable_config_param(self.func):
+            if config_param := _runnable_config_param(self.func):
                 kwargs[config_param] = config
 
-            return compile_object(self.func, arguments=kwargs, frame=sys._getframe(1))
+            return compile_object(self.func, arguments=kwargs, namespace=self._namespace)
 
         return await run_in_executor(
             None,
@@ -215,7 +250,7 @@ class ExtendedStructuredTool(BaseTool):
             )
             context = copy_context()
             context.run(_set_config_context, child_config)
-            if inspect.signature(self._run).parameters.get("run_manager"):
+            if _accepts_run_manager(self._run.__func__):
                 tool_input["run_manager"] = run_manager
             response = context.run(self._run, **tool_input)
             if self.response_format == "content_and_artifact":
@@ -297,9 +332,9 @@ class ExtendedStructuredTool(BaseTool):
             context = copy_context()
             context.run(_set_config_context, child_config)
             func_to_check = self._run if self.__class__._arun is BaseTool._arun else self._arun
-            if inspect.signature(func_to_check).parameters.get("run_manager"):
+            if _accepts_run_manager(func_to_check.__func__):  # type: ignore[union-attr]
                 tool_input["run_manager"] = run_manager
-            if config_param := _get_runnable_config_param(func_to_check):
+            if config_param := _runnable_config_param(func_to_check.__func__):  # type: ignore[union-attr]
                 tool_input[config_param] = config
             coro = context.run(self._arun, **tool_input)
             if asyncio_accepts_context():
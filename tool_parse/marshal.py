@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import inspect
+import copy
+import functools
+import sys
 import typing as t
-from enum import Enum
+import weakref
+from enum import EnumMeta
 from pathlib import Path
 from types import FrameType
 
@@ -10,9 +13,32 @@ from docstring_parser import Docstring, parse_from_object
 
 from . import _types as ts
 from . import exceptions
+from .compile import (
+    _MISSING,
+    _classify,
+    _needs_namespace,
+    _resolve_function_fields,
+    _resolve_namedtuple_fields,
+    _resolve_typeddict_fields,
+    _resolved_fields,
+)
 
 __all__ = "marshal_annotation", "marshal_object"
 
+# A type's __doc__ never changes at runtime, so the recursive-descent parse
+# is memoized on the target object. Undocumented functions skip the parser
+# entirely and share one empty Docstring; classes always go through it
+# because parse_from_object also collects PEP 224 attribute docstrings,
+# which exist independently of the class docstring.
+_EMPTY_DOCSTRING = Docstring()
+_parse_from_object = functools.lru_cache(maxsize=2048)(parse_from_object)
+
+
+def _cached_parse(__obj: t.Any) -> Docstring:
+    if isinstance(__obj, type) or getattr(__obj, "__doc__", None):
+        return _parse_from_object(__obj)
+    return _EMPTY_DOCSTRING
+
 
 def build_tool_description(docstring: Docstring):
     """
@@ -40,11 +66,23 @@ def map_param_to_description(docstring: Docstring) -> t.Dict[str, str]:
     """
     description_map = {}
     for param in docstring.params:
-        if param.description:
-            description_map[param.arg_name] = param.description
+        if desc := param.description:
+            # Similar tools repeat the same phrasing ("The location to
+            # query"); interning lets identical descriptions share one
+            # allocation without a container keeping them alive.
+            description_map[param.arg_name] = sys.intern(desc)
     return description_map
 
 
+@functools.lru_cache(maxsize=2048)
+def _cached_desc_map(__obj: t.Any) -> t.Dict[str, str]:
+    """
+    Parameter-description map for a target object, reduced from its parsed
+    docstring once per object; the generators only read the result.
+    """
+    return map_param_to_description(_cached_parse(__obj))
+
+
 class ParamMetadata(t.NamedTuple):
     label: str
     schema: t.Dict[str, t.Any]
@@ -69,42 +107,57 @@ def marshal_parameters(__params: t.Iterable[ParamMetadata]) -> t.Dict[str, t.Any
     return {"type": "object", "properties": properties, "required": required_props}
 
 
-def generate_function_metadata(
+def _finalize_parameters(properties: t.Dict[str, t.Any], required_props: t.List[str]):
+    if not properties:
+        return {}
+    return {"type": "object", "properties": properties, "required": required_props}
+
+
+def _marshal_function_parameters(
     __fn: ts.Function | ts.AsyncFunction, description_map: t.Dict[str, str], namespace: ts.NameSpace
 ):
     """
-    Generate metadata for a function.
+    Marshal the parameters of a function into a schema.
 
-    :param __fn: The function to generate metadata for.
+    Parameters come from the per-function resolution cache shared with the
+    compile path, so the signature is inspected once per function rather
+    than per marshal call.
+
+    :param __fn: The function to marshal parameters for.
     :param description_map: A dictionary mapping parameter names to descriptions.
     :param namespace: Global and local nampespace for evaluating annotation.
     """
-    for label, param in ts.get_signature(__fn, namespace=namespace).parameters.items():
-        annot_info = ts.extract_annotation_info(param.annotation, namespace=namespace)
+    properties: t.Dict[str, t.Any] = {}
+    required_props: t.List[str] = []
+    fields = _resolved_fields(__fn, namespace, _resolve_function_fields)
+    for label, annot_info, default, is_default_none, _ in fields:
         schema, is_optional = marshal_annotation(annot_info, namespace)
         if label in description_map:
             schema["description"] = description_map[label]
 
-        yield ParamMetadata(
-            label=label,
-            schema=schema,
-            required=bool(not is_optional and param.default is inspect._empty),
-        )
+        properties[label] = schema
+        # The resolver folds an absent default to None; explicit None
+        # defaults are distinguished by the is_default_none flag.
+        if not is_optional and default is None and not is_default_none:
+            required_props.append(label)
+    return _finalize_parameters(properties, required_props)
 
 
-def generate_pydantic_metadata(
+def _marshal_pydantic_parameters(
     __model: type[ts.PydanticModel], description_map: t.Dict[str, str], namespace: ts.NameSpace
 ):
     """
-    Generate metadata for a Pydantic model.
+    Marshal the fields of a Pydantic model into a schema.
 
-    :param __model: The Pydantic model to generate metadata for.
+    :param __model: The Pydantic model to marshal fields for.
     :param description_map: A dictionary mapping field names to descriptions.
     :param namespace: Global and local nampespace for evaluating annotation.
 
     :raises exceptions.RecursiveParameterException: If a recursive field is detected
     """
     name = __model.__name__
+    properties: t.Dict[str, t.Any] = {}
+    required_props: t.List[str] = []
     for label, field in __model.model_fields.items():
         annot_info = ts.extract_annotation_info(field.annotation, namespace=namespace)
         if annot_info[0] is __model or __model in annot_info[1]:
@@ -113,94 +166,98 @@ def generate_pydantic_metadata(
             )
         schema, is_optional = marshal_annotation(annot_info, namespace)
         if description := field.description or description_map.get(label):
-            schema["description"] = description
+            schema["description"] = sys.intern(description)
 
-        yield ParamMetadata(
-            label=label, schema=schema, required=bool(not is_optional and field.is_required())
-        )
+        properties[label] = schema
+        if not is_optional and field.is_required():
+            required_props.append(label)
+    return _finalize_parameters(properties, required_props)
 
 
-def _generate_typed_metadata(
+def _marshal_typed_parameters(
     __typed_obj: type,
     description_map: t.Dict[str, str],
     namespace: ts.NameSpace,
-    has_default: t.Callable[[str], bool],
-    type_base: str,
+    resolve: t.Callable[[t.Any, ts.NameSpace], t.Iterator[tuple]],
 ):
     """
-    Generate metadata for a typed object.
+    Marshal the fields of a typed object into a schema.
+
+    Field annotations come from the per-class resolution cache shared with
+    the compile path, so hints are evaluated once per class rather than per
+    marshal call.
 
-    :param __typed_obj: The typed object to generate metadata from..
+    :param __typed_obj: The typed object to marshal fields for.
     :param description_map: A dictionary mapping field names to descriptions.
     :param namespace: Global and local nampespace for evaluating annotation.
-    :param has_default: A function to check if a field has a default value.
-    :param type_base: The base type name.
+    :param resolve: Generator yielding per-field resolution tuples.
 
     :raises exceptions.RecursiveParameterException: If a recursive field is detected
     """
-    name = __typed_obj.__name__
-    for label, annotation in __typed_obj.__annotations__.items():
-        annot_info = ts.extract_annotation_info(annotation, namespace=namespace)
-        if annot_info[0] is __typed_obj or __typed_obj in annot_info[1]:
-            raise exceptions.RecursiveParameterException(
-                label=label, type_base=type_base, type_name=name
-            )
+    properties: t.Dict[str, t.Any] = {}
+    required_props: t.List[str] = []
+    for label, annot_info, default in _resolved_fields(__typed_obj, namespace, resolve):
         schema, is_optional = marshal_annotation(annot_info, namespace)
         if label in description_map:
             schema["description"] = description_map[label]
 
-        yield ParamMetadata(
-            label=label, schema=schema, required=not (is_optional or has_default(label))
-        )
+        properties[label] = schema
+        if not is_optional and default is _MISSING:
+            required_props.append(label)
+    return _finalize_parameters(properties, required_props)
 
 
-def generate_typeddict_metadata(
+def _marshal_typeddict_parameters(
     __td: type[ts.TypedDict], description_map: t.Dict[str, str], namespace: ts.NameSpace
 ):
     """
-    Generate metadata for a TypedDict.
+    Marshal the fields of a TypedDict into a schema.
 
-    :param __td: The TypedDict to generate metadata for.
+    :param __td: The TypedDict to marshal fields for.
     :param description_map: A dictionary mapping field names to descriptions.
     :param namespace: Global and local nampespace for evaluating annotation.
     """
-    return _generate_typed_metadata(
+    return _marshal_typed_parameters(
         __td,
         description_map=description_map,
         namespace=namespace,
-        has_default=lambda label: hasattr(__td, label),
-        type_base="TypeDict",
+        resolve=_resolve_typeddict_fields,
     )
 
 
-def generate_namedtuple_metadata(
+def _marshal_namedtuple_parameters(
     __nt: type[ts.NamedTuple], description_map: t.Dict[str, str], namespace: ts.NameSpace
 ):
     """
-    Generate metadata for a NamedTuple.
+    Marshal the fields of a NamedTuple into a schema.
 
-    :param __nt: The NamedTuple to generate metadata for.
+    :param __nt: The NamedTuple to marshal fields for.
     :param description_map: A dictionary mapping field names to descriptions.
     :param namespace: Global and local nampespace for evaluating annotation.
     """
-    return _generate_typed_metadata(
+    return _marshal_typed_parameters(
         __nt,
         description_map=description_map,
         namespace=namespace,
-        has_default=lambda label: label in __nt._field_defaults,
-        type_base="NamedTuple",
+        resolve=_resolve_namedtuple_fields,
     )
 
 
-def _get_param_generator(__obj: t.Any, check_fn: bool = False):
-    if ts.is_pydantic_model(__obj):
-        return generate_pydantic_metadata
-    elif ts.is_typeddict(__obj):
-        return generate_typeddict_metadata
-    elif ts.is_namedtuple(__obj):
-        return generate_namedtuple_metadata
-    elif inspect.isfunction(__obj) and check_fn:
-        return generate_function_metadata
+_PARAM_MARSHALERS = (
+    _marshal_pydantic_parameters,
+    _marshal_typeddict_parameters,
+    _marshal_namedtuple_parameters,
+    _marshal_function_parameters,
+)
+
+
+def _get_param_marshaler(__obj: t.Any, check_fn: bool = False):
+    # `_classify` memoizes the is_pydantic/is_typeddict/is_namedtuple/
+    # isfunction chain, shared with the compile-side dispatch.
+    kind = _classify(__obj)
+    if kind < 0 or (kind == 3 and not check_fn):
+        return None
+    return _PARAM_MARSHALERS[kind]
 
 
 def marshal_annotation(
@@ -230,24 +287,40 @@ def marshal_annotation(
             else:
                 return {"enum": args, "type": ts._SUPPORTED_TYPE_MAP[arg_type]}, is_optional
 
-    if ts.check_subclass(_type, Path):
-        return {"type": "string"}, is_optional
+    # Exact supported types — the common case for scalar parameters —
+    # resolve with one dict probe; the subclass checks below walk MROs and
+    # only matter for Path/Enum subclasses, which the map cannot hold.
+    if (tvalue := ts._SUPPORTED_TYPE_MAP.get(_type)) is not None:
+        return {"type": tvalue}, is_optional
 
-    if ts.check_subclass(_type, Enum):
+    # Every Enum class is an EnumMeta instance, so the metaclass check
+    # replaces the class-guard-plus-MRO-walk of check_subclass.
+    if isinstance(_type, EnumMeta):
         return {"type": "string", "enum": _type._member_names_}, is_optional
 
-    if (tvalue := ts._SUPPORTED_TYPE_MAP.get(_type)) is not None:
-        return {"type": tvalue}, is_optional
+    if ts.check_subclass(_type, Path):
+        return {"type": "string"}, is_optional
 
-    if (generate_fn := _get_param_generator(_type)) is not None:
-        desc_map = map_param_to_description(parse_from_object(_type))
-        return marshal_parameters(generate_fn(_type, desc_map, namespace)), is_optional
+    if (marshal_fn := _get_param_marshaler(_type)) is not None:
+        return marshal_fn(_type, _cached_desc_map(_type), namespace), is_optional
 
     raise exceptions.UnsupportedTypeException(
         type_hint_repr=ts.get_type_repr(_type), supported_repr=ts._SUPPORTED_TYPES_REPR
     )
 
 
+_SCHEMA_CACHE: "weakref.WeakKeyDictionary[t.Any, t.Dict[tuple, dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+"""
+Marshaled schemas keyed weakly on the target object, then on
+`(spec, name, description)`. The schema is a pure function of the target
+object, so long-lived processes regenerating the same tool schema per LLM
+turn hit this instead of re-walking the signature and re-parsing the
+docstring; dynamically created tools are released with their objects.
+"""
+
+
 def marshal_object(
     __obj: t.Any,
     *,
@@ -267,17 +340,35 @@ def marshal_object(
 
     :raises ValueError: If the object type is not supported for schema generation
     """
-    if (generate_fn := _get_param_generator(__obj, check_fn=True)) is None:
+    # Forward-reference-free signatures marshal identically regardless of
+    # the caller's frame, so their schemas are safe to memoize. A deep copy
+    # keeps the cached entry isolated from caller mutation.
+    cache_key: t.Optional[tuple] = None
+    per_obj: t.Optional[t.Dict[tuple, dict]] = None
+    if _needs_namespace(__obj) is False:
+        try:
+            per_obj = _SCHEMA_CACHE.get(__obj)
+        except TypeError:  # non-weakrefable target; marshal without caching
+            pass
+        else:
+            cache_key = (spec, name, description)
+            if per_obj is not None and (cached := per_obj.get(cache_key)) is not None:
+                return copy.deepcopy(cached)
+
+    if (marshal_fn := _get_param_marshaler(__obj, check_fn=True)) is None:
         raise ValueError("Schema generation failed, given object is not supported.")
 
     fn_schema = {"name": name or __obj.__name__}
-    ds = parse_from_object(__obj)
+    ds = _cached_parse(__obj)
     if desc := description or build_tool_description(ds):
         fn_schema["description"] = desc
 
     param_key = "input_schema" if spec == "claude" else "parameters"
-    fn_schema[param_key] = marshal_parameters(
-        generate_fn(__obj, map_param_to_description(ds), ts.extract_namespace(frame))
-    )
-
-    return {"type": "function", "function": fn_schema}
+    fn_schema[param_key] = marshal_fn(__obj, _cached_desc_map(__obj), ts.extract_namespace(frame))
+
+    schema = {"type": "function", "function": fn_schema}
+    if cache_key is not None:
+        if per_obj is None:
+            per_obj = _SCHEMA_CACHE[__obj] = {}
+        per_obj[cache_key] = copy.deepcopy(schema)
+    return schema